@@ -6,7 +6,7 @@ Displays your chess.com stats in an interactive browser dashboard.
 WINDOWS SETUP (VSCode):
 1. Open VSCode terminal (Ctrl + `)
 2. Install dependencies:
-   pip install flask pandas plotly requests
+   pip install flask pandas plotly aiohttp diskcache flask-caching orjson
 3. Run the script:
    python chess_dashboard.py
 4. Browser will auto-open to http://127.0.0.1:5000/
@@ -15,49 +15,143 @@ WINDOWS SETUP (VSCode):
 Configure your username and start date below.
 """
 
-import requests
+import asyncio
+import functools
+import jinja2
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
+import diskcache
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime
-from flask import Flask, render_template_string
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
+from datetime import datetime, timezone
+from flask import Flask, Response, request, stream_with_context
+from markupsafe import Markup
+from flask_caching import Cache
 import webbrowser
+import zlib
 from threading import Timer
 
 # --- USER CONFIGURATION ---
 USERNAME = "kxrook"       # Replace with your username
 START_DATE = "2025-11-01" # Format: YYYY-MM-DD
 GAME_INTERVAL = 10        # For the 2nd chart: Average rating every N games
+MAX_CONCURRENT_REQUESTS = 8  # Monthly archives downloaded in parallel
+DATA_CACHE_SECONDS = 60   # How long fetched dashboard data is reused
+CHART_WORKERS = 8         # Charts built in parallel per page load
+COMPRESS_LEVEL = 6        # gzip level for the dashboard page
+FLUSH_MARKER = Markup('<!-- flush -->')  # Template point where buffered output is sent
+CACHE_DIR = "cache"       # API responses are cached on disk between runs
+
+cache = diskcache.Cache(CACHE_DIR)
+
+# Charts are sent as JSON and drawn by a single shared copy of plotly.js
+PLOTLY_JS_URL = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+pio.json.config.default_engine = 'orjson'
+
+# Plain-dict copy of the dark theme, see dark_template()
+DARK_TEMPLATE = pio.templates['plotly_dark'].to_plotly_json()
+
+MODES = ['Rapid', 'Blitz', 'Bullet', 'Daily', 'Rapid960', 'Blitz960', 'Bullet960', 'Daily960']
+STATUSES = ['Win', 'Draw', 'Loss']
+EPOCH = datetime(1970, 1, 1)
+
+# chess.com result codes from the player's side; anything unlisted counts as a draw
+GAME_STATUS = {
+    'win': 'Win',
+    'agreed': 'Draw', 'repetition': 'Draw', 'stalemate': 'Draw',
+    'insufficient_material': 'Draw', '50move': 'Draw', 'timevsinsufficientmaterial': 'Draw',
+    'checkmated': 'Loss', 'resigned': 'Loss', 'timeout': 'Loss', 'abandoned': 'Loss'
+}
+# Same mapping as positions in STATUSES, so results are stored as small ints
+STATUS_CODES = {result: STATUSES.index(status) for result, status in GAME_STATUS.items()}
+DRAW_CODE = STATUSES.index('Draw')
 
 # --- HELPER FUNCTIONS ---
 def get_headers():
     return {'User-Agent': 'VSCodeChessDashboard/4.0'}
 
-def get_data(url):
-    try:
-        response = requests.get(url, headers=get_headers())
-        if response.status_code == 200:
-            return response.json()
-    except Exception as e:
-        print(f"Error fetching {url}: {e}")
+def is_month_url(url):
+    """True for a monthly archive URL, which ends in /YYYY/MM"""
+    parts = url.split('/')
+    return parts[-2].isdigit() and parts[-1].isdigit()
+
+def cache_expiry(url):
+    """Seconds to keep a cached response, None to keep it forever"""
+    if is_month_url(url):
+        # Monthly archive: closed months never change, the current one does
+        parts = url.split('/')
+        now = datetime.now(timezone.utc)
+        if (int(parts[-2]), int(parts[-1])) < (now.year, now.month):
+            return None
+        return 600
+    # Profile, stats and the archives index
+    return 60
+
+def utc_offset(timestamp):
+    """Local UTC offset in seconds at the given epoch time"""
+    return int((datetime.fromtimestamp(timestamp) - EPOCH).total_seconds()) - timestamp
+
+def to_local_datetime(seconds):
+    """Vectorized datetime.fromtimestamp: epoch seconds to naive local times"""
+    seconds = np.asarray(seconds, dtype='int64')
+
+    # The offset only changes on DST transition days, so look it up once per day
+    days, inverse = np.unique(seconds // 86400 * 86400, return_inverse=True)
+    day_start = np.array([utc_offset(day) for day in days.tolist()], dtype='int64')
+    day_end = np.array([utc_offset(day + 86400) for day in days.tolist()], dtype='int64')
+    offsets = day_start[inverse]
+
+    # Games on a transition day get their own lookup
+    changed = (day_start != day_end)[inverse]
+    offsets[changed] = [utc_offset(t) for t in seconds[changed].tolist()]
+
+    return pd.to_datetime(seconds + offsets, unit='s')
+
+async def fetch(session, semaphore, url):
+    data = cache.get(url)
+    if data is not None:
+        return data
+
+    async with semaphore:
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    cache.set(url, data, expire=cache_expiry(url))
+                    return data
+                if response.status == 404 and is_month_url(url):
+                    # Monthly archive without games, cached like any other month
+                    data = {'games': []}
+                    cache.set(url, data, expire=cache_expiry(url))
+                    return data
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
     return None
 
-def process_all_modes(username, start_date_str):
-    """Fetches games from a specific date onwards"""
-    try:
-        start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
-        start_timestamp = start_dt.timestamp()
-    except ValueError:
-        print("❌ Error: Date format must be YYYY-MM-DD")
-        return pd.DataFrame()
+async def fetch_archives(session, semaphore, username, start_dt):
+    """Downloads every monthly archive from start_dt onwards concurrently"""
+    # Archive URLs follow a fixed schema, so request each month directly
+    months = pd.date_range(start_dt.replace(day=1), datetime.now(timezone.utc).replace(tzinfo=None), freq='MS')
+    month_urls = [f"https://api.chess.com/pub/player/{username}/games/{month.year}/{month.month:02d}" for month in months]
+
+    print(f"📥 Downloading games from {len(month_urls)} month(s)...")
 
-    archives = get_data(f"https://api.chess.com/pub/player/{username}/games/archives")
-    if not archives: return pd.DataFrame()
+    monthly_data = await asyncio.gather(*(fetch(session, semaphore, url) for url in month_urls))
+    if all(data is not None for data in monthly_data):
+        return monthly_data
+
+    # Some month could not be fetched, fall back to the months listed in the archives index
+    archives = await fetch(session, semaphore, f"https://api.chess.com/pub/player/{username}/games/archives")
+    if not archives: return []
 
     all_archives = archives.get('archives', [])
     relevant_archives = []
 
-    print(f"🔍 Filtering archives starting from {start_date_str}...")
+    print(f"🔍 Filtering archives starting from {start_dt:%Y-%m-%d}...")
 
     for url in all_archives:
         parts = url.split('/')
@@ -69,73 +163,149 @@ def process_all_modes(username, start_date_str):
 
     print(f"📥 Downloading games from {len(relevant_archives)} month(s)...")
 
-    history_data = []
+    return await asyncio.gather(*(fetch(session, semaphore, url) for url in relevant_archives))
+
+async def load_dashboard_data(username, start_date_str):
+    """Fetches the profile, current stats and games concurrently over one session"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, ttl_dns_cache=300)
+
+    async with aiohttp.ClientSession(headers=get_headers(), connector=connector) as session:
+        return await asyncio.gather(
+            fetch(session, semaphore, f"https://api.chess.com/pub/player/{username}"),
+            fetch(session, semaphore, f"https://api.chess.com/pub/player/{username}/stats"),
+            process_all_modes(session, semaphore, username, start_date_str)
+        )
 
-    for url in relevant_archives:
-        data = get_data(url)
+async def process_all_modes(session, semaphore, username, start_date_str):
+    """Fetches games from a specific date onwards"""
+    try:
+        start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
+        start_timestamp = start_dt.timestamp()
+    except ValueError:
+        print("❌ Error: Date format must be YYYY-MM-DD")
+        return pd.DataFrame()
+
+    monthly_data = await fetch_archives(session, semaphore, username, start_dt)
+    missing_months = sum(data is None for data in monthly_data)
+
+    # Pull only the fields we use into one list per column
+    end_times, time_classes, rules = [], [], []
+    white_usernames, white_ratings, white_statuses = [], [], []
+    black_ratings, black_statuses = [], []
+
+    for data in monthly_data:
         if not data: continue
 
         for game in data.get('games', []):
-            if game['end_time'] < start_timestamp:
-                continue
-
-            time_class = game.get('time_class')
-            rules = game.get('rules', 'chess')
-            is_960 = (rules == 'chess960')
-
-            if time_class in ['rapid', 'blitz', 'bullet', 'daily']:
-                if game['white']['username'].lower() == username.lower():
-                    user_color = 'white'
-                else:
-                    user_color = 'black'
-
-                rating = game[user_color]['rating']
-                end_time = datetime.fromtimestamp(game['end_time'])
-
-                game_result = game[user_color]['result']
-                game_status = 'Draw'
-                if game_result in ['win', 'agreed', 'repetition', 'stalemate', 'insufficient_material', '50move', 'timevsinsufficientmaterial']:
-                    if game_result == 'win':
-                        game_status = 'Win'
-                    else:
-                        game_status = 'Draw'
-                elif game_result in ['checkmated', 'resigned', 'timeout', 'abandoned']:
-                    game_status = 'Loss'
-
-                # Determine mode with 960 suffix if applicable
-                mode_name = time_class.capitalize()
-                if is_960:
-                    mode_name = f"{mode_name}960"
-
-                history_data.append({
-                    'Date': end_time,
-                    'Rating': rating,
-                    'Mode': mode_name,
-                    'Status': game_status,
-                    'Is960': is_960
-                })
-
-    return pd.DataFrame(history_data)
+            end_times.append(game['end_time'])
+            time_classes.append(game.get('time_class'))
+            rules.append(game.get('rules', 'chess'))
+            white_usernames.append(game['white']['username'])
+            white_ratings.append(game['white']['rating'])
+            white_statuses.append(STATUS_CODES.get(game['white']['result'], DRAW_CODE))
+            black_ratings.append(game['black']['rating'])
+            black_statuses.append(STATUS_CODES.get(game['black']['result'], DRAW_CODE))
+
+    raw = pd.DataFrame({
+        'end_time': end_times,
+        'time_class': time_classes,
+        'rules': rules,
+        'white_username': white_usernames,
+        'white_rating': white_ratings,
+        'white_status': np.array(white_statuses, dtype='int8'),
+        'black_rating': black_ratings,
+        'black_status': np.array(black_statuses, dtype='int8')
+    })
+    raw = raw[(raw['end_time'] >= start_timestamp) &
+              raw['time_class'].isin(['rapid', 'blitz', 'bullet', 'daily'])]
+
+    if raw.empty:
+        return pd.DataFrame()
+
+    is_white = raw['white_username'].str.lower().eq(username.lower())
+    is_960 = raw['rules'].eq('chess960')
+    status_codes = np.where(is_white, raw['white_status'], raw['black_status'])
+
+    df = pd.DataFrame({
+        'Date': to_local_datetime(raw['end_time']),
+        'Rating': np.where(is_white, raw['white_rating'], raw['black_rating']),
+        # Mode carries a 960 suffix for Chess960 games
+        'Mode': raw['time_class'].str.capitalize() + np.where(is_960, '960', ''),
+        'Status': pd.Categorical.from_codes(status_codes, categories=STATUSES),
+        'Is960': is_960
+    }).reset_index(drop=True)
+
+    # Narrow types: a handful of categories and ratings that fit in 16 bits
+    df['Mode'] = pd.Categorical(df['Mode'], categories=MODES)
+    df['Rating'] = df['Rating'].astype('int16')
+    df['Is960'] = df['Is960'].astype(bool)
+
+    # Derived columns shared by every chart
+    df['DateOnly'] = df['Date'].dt.floor('D')
+    df['Week'] = df['Date'].dt.to_period('W').dt.start_time
+    df['IsWin'] = (df['Status'] == 'Win').astype('int8')
+    # Mode without the 960 suffix, so both variants share a colour
+    df['ModeColor'] = df['Mode'].str.replace('960', '', regex=False)
+
+    # Months that could not be fetched, so the load is not cached as complete
+    df.attrs['missing_months'] = missing_months
+
+    return df
+
+# --- CHART CACHING ---
+class DataFingerprint:
+    """Hashable stand-in for a games DataFrame.
+
+    Games are only ever appended in chronological order, so the row count
+    plus the time of the last game identify the data.
+    """
+    def __init__(self, df):
+        self.df = df
+        self.key = (len(df), df['Date'].iloc[-1].value if len(df) else None)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+def memoize_chart(func):
+    """Reuses a chart's JSON while the DataFrame and arguments are unchanged"""
+    @functools.lru_cache(maxsize=32)
+    def cached(fingerprint, *args, **kwargs):
+        return func(fingerprint.df, *args, **kwargs)
+
+    @functools.wraps(func)
+    def wrapper(df, *args, **kwargs):
+        return cached(DataFingerprint(df), *args, **kwargs)
+    return wrapper
 
 # --- CHART GENERATION ---
+def dark_template():
+    """Fresh copy of the dark theme for one figure.
+
+    plotly's shared template objects are not thread-safe, and charts are
+    built on several threads at once.
+    """
+    return go.layout.Template(DARK_TEMPLATE)
+
+@memoize_chart
 def create_overall_performance_chart(df):
     """Chart: Overall performance across all game modes - stacked bar showing wins, draws, and losses"""
     if df.empty:
         return "<p>No games found.</p>"
     
-    df_copy = df.copy()
-    df_copy['DateOnly'] = df_copy['Date'].dt.date
-    df_copy['DateOnly'] = pd.to_datetime(df_copy['DateOnly'])
-    
     # Calculate daily totals
-    daily_stats = df_copy.groupby('DateOnly').agg({
-        'Status': lambda x: [(x == 'Win').sum(), (x == 'Draw').sum(), (x == 'Loss').sum()]
-    }).reset_index()
-    
-    # Expand the Status column into separate columns
-    daily_stats['Wins'] = daily_stats['Status'].apply(lambda x: x[0])
-    daily_stats['Draws'] = daily_stats['Status'].apply(lambda x: x[1])
-    daily_stats['Losses'] = daily_stats['Status'].apply(lambda x: x[2])
+    daily_stats = df.assign(
+        IsDraw=(df['Status'] == 'Draw').astype('int8'),
+        IsLoss=(df['Status'] == 'Loss').astype('int8')
+    ).groupby('DateOnly').agg(
+        Wins=('IsWin', 'sum'),
+        Draws=('IsDraw', 'sum'),
+        Losses=('IsLoss', 'sum')
+    ).reset_index()
+    
     daily_stats['TotalGames'] = daily_stats['Wins'] + daily_stats['Draws'] + daily_stats['Losses']
     daily_stats['WinPct'] = (daily_stats['Wins'] / daily_stats['TotalGames'] * 100).round(1)
     
@@ -172,7 +342,7 @@ def create_overall_performance_chart(df):
     # Update layout for stacked bars
     fig.update_layout(
         title=f'Overall Performance - All Game Modes (Since {START_DATE})',
-        template='plotly_dark',
+        template=dark_template(),
         xaxis=dict(title='Date'),
         yaxis=dict(title='Games Played'),
         barmode='stack',
@@ -187,36 +357,22 @@ def create_overall_performance_chart(df):
         height=450
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs='cdn')
+    return pio.to_json(fig, validate=False, pretty=False)
 
-def create_daily_games_chart(df, is_960=False):
+@memoize_chart
+def create_daily_games_chart(filtered_df, is_960=False):
     """Chart: Total games played by day"""
-    # Filter for 960 or standard games
-    filtered_df = df[df['Is960'] == is_960].copy()
-    
     if filtered_df.empty:
         return "<p>No games found for this variant.</p>"
     
-    filtered_df['DateOnly'] = filtered_df['Date'].dt.date
-    
     # Count games per day per mode
-    daily_counts = filtered_df.groupby(['DateOnly', 'Mode']).size().reset_index(name='Games')
-    daily_counts['DateOnly'] = pd.to_datetime(daily_counts['DateOnly'])
-    
-    # Remove '960' suffix from mode names for consistent coloring
-    mode_map = {
-        'Rapid960': 'Rapid', 'Blitz960': 'Blitz', 
-        'Bullet960': 'Bullet', 'Daily960': 'Daily',
-        'Rapid': 'Rapid', 'Blitz': 'Blitz',
-        'Bullet': 'Bullet', 'Daily': 'Daily'
-    }
-    daily_counts['ModeColor'] = daily_counts['Mode'].map(mode_map)
+    daily_counts = filtered_df.groupby(['DateOnly', 'Mode', 'ModeColor'], observed=True).size().reset_index(name='Games')
     
     title = f'Total Games Played by Day - Chess 960 (Since {START_DATE})' if is_960 else f'Total Games Played by Day - Standard Chess (Since {START_DATE})'
     
     fig = px.bar(daily_counts, x='DateOnly', y='Games', color='ModeColor',
                   title=title,
-                  template='plotly_dark',
+                  template=dark_template(),
                   color_discrete_map={'Rapid': '#76b900', 'Blitz': '#F0C800', 'Bullet': '#ca3431', 'Daily': '#00BFFF'},
                   labels={'DateOnly': 'Date', 'Games': 'Games Played'})
     
@@ -229,35 +385,21 @@ def create_daily_games_chart(df, is_960=False):
     
     fig.update_layout(hovermode='x unified', barmode='stack')
     
-    return fig.to_html(full_html=False, include_plotlyjs='cdn')
+    return pio.to_json(fig, validate=False, pretty=False)
 
-def create_daily_average_chart(df, is_960=False):
+@memoize_chart
+def create_daily_average_chart(filtered_df, is_960=False):
     """Chart 1: Average ELO by day and time mode"""
-    # Filter for 960 or standard games
-    filtered_df = df[df['Is960'] == is_960].copy()
-    
     if filtered_df.empty:
         return "<p>No games found for this variant.</p>"
     
-    filtered_df['DateOnly'] = filtered_df['Date'].dt.date
-    
-    daily_avg = filtered_df.groupby(['DateOnly', 'Mode'])['Rating'].mean().reset_index()
-    daily_avg['DateOnly'] = pd.to_datetime(daily_avg['DateOnly'])
-    
-    # Remove '960' suffix from mode names for consistent coloring
-    mode_map = {
-        'Rapid960': 'Rapid', 'Blitz960': 'Blitz', 
-        'Bullet960': 'Bullet', 'Daily960': 'Daily',
-        'Rapid': 'Rapid', 'Blitz': 'Blitz',
-        'Bullet': 'Bullet', 'Daily': 'Daily'
-    }
-    daily_avg['ModeColor'] = daily_avg['Mode'].map(mode_map)
+    daily_avg = filtered_df.groupby(['DateOnly', 'Mode', 'ModeColor'], observed=True)['Rating'].mean().reset_index()
     
     title = f'Average ELO by Day - Chess 960 (Since {START_DATE})' if is_960 else f'Average ELO by Day - Standard Chess (Since {START_DATE})'
     
     fig = px.line(daily_avg, x='DateOnly', y='Rating', color='ModeColor',
                   title=title,
-                  template='plotly_dark',
+                  template=dark_template(),
                   color_discrete_map={'Rapid': '#76b900', 'Blitz': '#F0C800', 'Bullet': '#ca3431', 'Daily': '#00BFFF'},
                   labels={'DateOnly': 'Date', 'Rating': 'Average Rating'})
     
@@ -271,79 +413,51 @@ def create_daily_average_chart(df, is_960=False):
     fig.update_traces(mode='lines+markers')
     fig.update_layout(hovermode='x unified')
     
-    return fig.to_html(full_html=False, include_plotlyjs='cdn')
+    return pio.to_json(fig, validate=False, pretty=False)
 
-def create_interval_table(df, is_960=False):
+@memoize_chart
+def create_interval_table(filtered_df, is_960=False):
     """Chart 2: Table showing average ELO and win % at every N-game interval"""
-    # Filter for 960 or standard games
-    filtered_df = df[df['Is960'] == is_960].copy()
-    
     if filtered_df.empty:
         return "<p>No games found for this variant.</p>"
     
-    # Add game count per mode
+    # Running totals per mode give the average rating and win % after every game
     filtered_df = filtered_df.sort_values(['Mode', 'Date'])
-    filtered_df['GameCount'] = filtered_df.groupby('Mode').cumcount() + 1
+    mode_groups = filtered_df.groupby('Mode', observed=True)
+    filtered_df['GameCount'] = mode_groups.cumcount() + 1
+    filtered_df['CumRating'] = mode_groups['Rating'].cumsum()
+    filtered_df['CumWins'] = mode_groups['IsWin'].cumsum()
     
     # Filter to interval milestones
-    df_intervals = filtered_df[filtered_df['GameCount'] % GAME_INTERVAL == 0].copy()
+    df_intervals = filtered_df[filtered_df['GameCount'] % GAME_INTERVAL == 0]
     
     if df_intervals.empty:
         return "<p>Not enough games to show intervals yet.</p>"
     
-    # Calculate average rating and win percentage at each interval
-    interval_stats = []
-    for mode in filtered_df['Mode'].unique():
-        mode_data = filtered_df[filtered_df['Mode'] == mode]
-        for game_count in range(GAME_INTERVAL, len(mode_data) + 1, GAME_INTERVAL):
-            # Get games up to this point
-            games_up_to_interval = mode_data.iloc[:game_count]
-            avg_rating = games_up_to_interval['Rating'].mean()
-            wins = len(games_up_to_interval[games_up_to_interval['Status'] == 'Win'])
-            win_pct = (wins / game_count * 100)
-            
-            interval_stats.append({
-                'Mode': mode,
-                'Games Played': game_count,
-                'Average Rating': int(round(avg_rating)),
-                'Win %': win_pct
-            })
-    
-    interval_df = pd.DataFrame(interval_stats)
-    
-    # Create pivot table for ratings with win percentage
-    pivot_data = {}
-    pivot_data['Games Played'] = sorted(interval_df['Games Played'].unique())
+    interval_df = pd.DataFrame({
+        'Mode': df_intervals['Mode'],
+        'Games Played': df_intervals['GameCount'],
+        'Average Rating': (df_intervals['CumRating'] / df_intervals['GameCount']).round().astype(int),
+        'Win %': df_intervals['CumWins'] / df_intervals['GameCount'] * 100
+    })
     
     mode_list = ['Blitz960', 'Bullet960', 'Rapid960', 'Daily960'] if is_960 else ['Blitz', 'Bullet', 'Rapid', 'Daily']
     
-    for mode in mode_list:
-        mode_data = interval_df[interval_df['Mode'] == mode]
-        if not mode_data.empty:
-            # Create formatted strings with rating and win %
-            mode_values = []
-            for games in pivot_data['Games Played']:
-                row_data = mode_data[mode_data['Games Played'] == games]
-                if not row_data.empty:
-                    rating = int(row_data['Average Rating'].values[0])
-                    win_pct = row_data['Win %'].values[0]
-                    mode_values.append(f"{rating} ({win_pct:.1f}%)")
-                else:
-                    mode_values.append('-')
-            pivot_data[mode] = mode_values
-        else:
-            pivot_data[mode] = ['-'] * len(pivot_data['Games Played'])
+    # Pivot to one row per interval and one "rating (win %)" column per mode
+    interval_df['Cell'] = interval_df['Average Rating'].astype(str) + ' (' + interval_df['Win %'].map('{:.1f}'.format) + '%)'
+    pivot_df = interval_df.pivot(index='Games Played', columns='Mode', values='Cell')
+    pivot_df = pivot_df.reindex(columns=mode_list).astype(object).fillna('-')
+    games_played = pivot_df.index.tolist()
     
     # Create column headers with total games played
+    mode_totals = filtered_df['Mode'].value_counts()
     column_headers = ['Games Played']
     for mode in mode_list:
-        mode_games = filtered_df[filtered_df['Mode'] == mode]
-        total_games = len(mode_games)
+        total_games = mode_totals.get(mode, 0)
+        display_name = mode.replace('960', ' 960') if is_960 else mode
         if total_games > 0:
-            display_name = mode.replace('960', ' 960') if is_960 else mode
             column_headers.append(f'{display_name}<br>{total_games} total games')
         else:
-            display_name = mode.replace('960', ' 960') if is_960 else mode
             column_headers.append(display_name)
     
     # Create plotly table
@@ -356,7 +470,7 @@ def create_interval_table(df, is_960=False):
             height=50
         ),
         cells=dict(
-            values=[pivot_data['Games Played']] + [pivot_data.get(mode, ['-']*len(pivot_data['Games Played'])) for mode in mode_list],
+            values=[games_played] + [pivot_df[mode].tolist() for mode in mode_list],
             fill_color='#2d2d2d',
             font=dict(color='white', size=12),
             align='center',
@@ -367,47 +481,33 @@ def create_interval_table(df, is_960=False):
     variant_text = 'Chess 960' if is_960 else 'Standard Chess'
     fig.update_layout(
         title=f'Average Rating (Win %) at Every {GAME_INTERVAL} Games - {variant_text}',
-        template='plotly_dark',
-        height=400 + (len(pivot_data['Games Played']) * 35)
+        template=dark_template(),
+        height=400 + (len(games_played) * 35)
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs='cdn')
+    return pio.to_json(fig, validate=False, pretty=False)
 
-def create_weekly_stats_table(df, is_960=False):
+@memoize_chart
+def create_weekly_stats_table(filtered_df, is_960=False):
     """Chart 3: Weekly game statistics showing games played, win percentage, and average ELO"""
-    # Filter for 960 or standard games
-    filtered_df = df[df['Is960'] == is_960].copy()
-    
     if filtered_df.empty:
         return "<p>No games found for this variant.</p>"
     
-    # Add week column
-    filtered_df['Week'] = filtered_df['Date'].dt.to_period('W').apply(lambda x: x.start_time)
-    
-    # Calculate stats per week and mode
-    weekly_stats = []
-    
     mode_list = ['Blitz960', 'Bullet960', 'Rapid960', 'Daily960'] if is_960 else ['Blitz', 'Bullet', 'Rapid', 'Daily']
     
-    for week in sorted(filtered_df['Week'].unique(), reverse=True):
-        week_data = filtered_df[filtered_df['Week'] == week]
-        row = {'Week': week.strftime('%Y-%m-%d')}
-        
-        for mode in mode_list:
-            mode_data = week_data[week_data['Mode'] == mode]
-            if len(mode_data) > 0:
-                total_games = len(mode_data)
-                wins = len(mode_data[mode_data['Status'] == 'Win'])
-                win_pct = (wins / total_games * 100)
-                avg_elo = int(round(mode_data['Rating'].mean()))
-                row[f'{mode}'] = f"{total_games} ({win_pct:.1f}%) - {avg_elo}"
-            else:
-                row[f'{mode}'] = "-"
-        
-        weekly_stats.append(row)
+    # Calculate stats per week and mode in a single pass
+    weekly_stats = filtered_df.groupby(['Week', 'Mode'], observed=True).agg(
+        Games=('Rating', 'size'),
+        Wins=('IsWin', 'sum'),
+        AvgElo=('Rating', 'mean')
+    )
+    win_pct = weekly_stats['Wins'] / weekly_stats['Games'] * 100
+    cells = (weekly_stats['Games'].astype(str) + ' (' + win_pct.map('{:.1f}'.format) + '%) - '
+             + weekly_stats['AvgElo'].round().astype(int).astype(str))
     
-    # Create dataframe
-    weekly_df = pd.DataFrame(weekly_stats)
+    # One row per week (newest first), one column per mode
+    weekly_df = cells.unstack('Mode').reindex(columns=mode_list).astype(object).fillna('-').sort_index(ascending=False)
+    weekly_df['Week'] = weekly_df.index.strftime('%Y-%m-%d')
     
     # Create plotly table
     columns = ['Week'] + mode_list
@@ -433,21 +533,62 @@ def create_weekly_stats_table(df, is_960=False):
     variant_text = 'Chess 960' if is_960 else 'Standard Chess'
     fig.update_layout(
         title=f'Weekly Game Statistics - {variant_text}',
-        template='plotly_dark',
+        template=dark_template(),
         height=min(600, 400 + (len(weekly_df) * 35))
     )
     
-    return fig.to_html(full_html=False, include_plotlyjs='cdn')
+    return pio.to_json(fig, validate=False, pretty=False)
+
+chart_executor = ThreadPoolExecutor(max_workers=CHART_WORKERS)
+
+def safe_chart(func, *args):
+    """Runs a chart builder, turning a failure into an inline message.
+
+    The page is already streaming when a chart is awaited, so an exception
+    there would cut the response off halfway.
+    """
+    try:
+        return func(*args)
+    except Exception as e:
+        print(f"Error building {func.__name__}: {e}")
+        return "<p>⚠️ This chart could not be built.</p>"
+
+def build_charts(df):
+    """Starts building every dashboard chart in parallel, returns futures keyed by template name"""
+    # Split once into standard and Chess 960 games
+    variants = dict(tuple(df.groupby('Is960')))
+    standard_df = variants.get(False, df.iloc[:0])
+    chess960_df = variants.get(True, df.iloc[:0])
+
+    chart_tasks = {
+        # Overall performance chart (all modes combined)
+        'chart_overall': (create_overall_performance_chart, df),
+        # Charts for standard chess
+        'chart0_standard': (create_daily_games_chart, standard_df, False),
+        'chart1_standard': (create_daily_average_chart, standard_df, False),
+        'chart2_standard': (create_interval_table, standard_df, False),
+        'chart3_standard': (create_weekly_stats_table, standard_df, False),
+        # Charts for Chess 960
+        'chart0_960': (create_daily_games_chart, chess960_df, True),
+        'chart1_960': (create_daily_average_chart, chess960_df, True),
+        'chart2_960': (create_interval_table, chess960_df, True),
+        'chart3_960': (create_weekly_stats_table, chess960_df, True)
+    }
+
+    # Every task only reads the shared DataFrame
+    return {name: chart_executor.submit(safe_chart, *task) for name, task in chart_tasks.items()}
 
 
 # --- FLASK APP ---
 app = Flask(__name__)
+data_cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': DATA_CACHE_SECONDS})
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>Chess.com Dashboard - {{ username }}</title>
+    <script src="{{ plotly_js_url }}"></script>
     <style>
         body {
             background-color: #1a1a1a;
@@ -533,13 +674,23 @@ HTML_TEMPLATE = """
     </style>
 </head>
 <body>
+    {% macro chart(chart_id) %}
+    {% set content = charts[chart_id].result() %}
+    {% if content.startswith('{') %}
+    <div id="{{ chart_id }}"></div>
+    <script>Plotly.newPlot('{{ chart_id }}', Object.assign({{ content|safe }}, {config: {responsive: true}}));</script>
+    {% else %}
+    {{ content|safe }}
+    {% endif %}
+    {% endmacro %}
     <div class="container">
         <h1>♟️ Chess.com Performance Dashboard</h1>
         <div class="subtitle">{{ username }} | Since {{ start_date }}</div>
         
         <div class="chart-container">
             <h2>📊 Overall Performance - All Game Modes</h2>
-            {{ chart_overall|safe }}
+            {{ flush }}
+            {{ chart('chart_overall') }}
         </div>
         
         <div class="section-header">♔ Standard Chess</div>
@@ -562,22 +713,26 @@ HTML_TEMPLATE = """
         
         <div class="chart-container">
             <h2>📊 Total Games Played by Day</h2>
-            {{ chart0_standard|safe }}
+            {{ flush }}
+            {{ chart('chart0_standard') }}
         </div>
         
         <div class="chart-container">
             <h2>📈 Average ELO by Day</h2>
-            {{ chart1_standard|safe }}
+            {{ flush }}
+            {{ chart('chart1_standard') }}
         </div>
         
         <div class="chart-container">
             <h2>📊 Average Rating Every {{ interval }} Games</h2>
-            {{ chart2_standard|safe }}
+            {{ flush }}
+            {{ chart('chart2_standard') }}
         </div>
         
         <div class="chart-container">
             <h2>📅 Weekly Game Statistics</h2>
-            {{ chart3_standard|safe }}
+            {{ flush }}
+            {{ chart('chart3_standard') }}
         </div>
         
         <div class="section-header">♚ Chess 960</div>
@@ -600,41 +755,56 @@ HTML_TEMPLATE = """
         
         <div class="chart-container">
             <h2>📊 Total Games Played by Day</h2>
-            {{ chart0_960|safe }}
+            {{ flush }}
+            {{ chart('chart0_960') }}
         </div>
         
         <div class="chart-container">
             <h2>📈 Average ELO by Day</h2>
-            {{ chart1_960|safe }}
+            {{ flush }}
+            {{ chart('chart1_960') }}
         </div>
         
         <div class="chart-container">
             <h2>📊 Average Rating Every {{ interval }} Games</h2>
-            {{ chart2_960|safe }}
+            {{ flush }}
+            {{ chart('chart2_960') }}
         </div>
         
         <div class="chart-container">
             <h2>📅 Weekly Game Statistics</h2>
-            {{ chart3_960|safe }}
+            {{ flush }}
+            {{ chart('chart3_960') }}
         </div>
     </div>
 </body>
 </html>
 """
 
+# Parsed once at import instead of on every request
+DASHBOARD_TEMPLATE = jinja2.Environment(autoescape=True, auto_reload=False, cache_size=400).from_string(HTML_TEMPLATE)
+
+def is_complete(data):
+    """Only reuse loads where every fetch succeeded and games were found"""
+    profile, stats, df = data
+    return (bool(profile) and stats is not None and not df.empty
+            and not df.attrs.get('missing_months'))
+
+@data_cache.memoize(response_filter=is_complete)
+def load_data(username, start_date_str):
+    print("--- FETCHING PROFILE, RATINGS AND GAMES ---")
+    return asyncio.run(load_dashboard_data(username, start_date_str))
+
 @app.route('/')
 def dashboard():
-    print("--- FETCHING PROFILE ---")
-    profile = get_data(f"https://api.chess.com/pub/player/{USERNAME}")
+    profile, stats, df = load_data(USERNAME, START_DATE)
     
     if not profile:
         return "<h1>❌ User not found</h1>"
     
     print(f"♟️  Processing data for: {profile.get('username')}")
     
-    # Fetch current ratings
-    print("--- FETCHING CURRENT RATINGS ---")
-    stats = get_data(f"https://api.chess.com/pub/player/{USERNAME}/stats")
+    # Current ratings
     current_ratings = {}
     
     if stats:
@@ -650,46 +820,59 @@ def dashboard():
                 mode_name = f"{base_mode}960"
                 current_ratings[mode_name] = stats[mode]['last']['rating']
     
-    df = process_all_modes(USERNAME, START_DATE)
-    
     if df.empty:
         return f"<h1>⚠️ No games found since {START_DATE}</h1>"
     
     # Generate game count stats
-    game_counts = df['Mode'].value_counts().to_dict()
+    mode_counts = df['Mode'].value_counts()
+    game_counts = mode_counts[mode_counts > 0].to_dict()
     
-    # Generate overall performance chart (all modes combined)
-    chart_overall = create_overall_performance_chart(df)
+    charts = build_charts(df)
     
-    # Generate charts for standard chess
-    chart0_standard = create_daily_games_chart(df, is_960=False)
-    chart1_standard = create_daily_average_chart(df, is_960=False)
-    chart2_standard = create_interval_table(df, is_960=False)
-    chart3_standard = create_weekly_stats_table(df, is_960=False)
-    
-    # Generate charts for Chess 960
-    chart0_960 = create_daily_games_chart(df, is_960=True)
-    chart1_960 = create_daily_average_chart(df, is_960=True)
-    chart2_960 = create_interval_table(df, is_960=True)
-    chart3_960 = create_weekly_stats_table(df, is_960=True)
-    
-    return render_template_string(
-        HTML_TEMPLATE,
+    # Stream the page so the header and each chart reach the browser as soon as
+    # they are ready; the template waits on each chart's future in page order
+    page = DASHBOARD_TEMPLATE.generate(
         username=profile.get('username'),
         start_date=START_DATE,
+        plotly_js_url=PLOTLY_JS_URL,
         game_counts=game_counts,
         current_ratings=current_ratings,
         interval=GAME_INTERVAL,
-        chart_overall=chart_overall,
-        chart0_standard=chart0_standard,
-        chart1_standard=chart1_standard,
-        chart2_standard=chart2_standard,
-        chart3_standard=chart3_standard,
-        chart0_960=chart0_960,
-        chart1_960=chart1_960,
-        chart2_960=chart2_960,
-        chart3_960=chart3_960
+        charts=charts,
+        flush=FLUSH_MARKER
     )
+    page = buffer_stream(page)
+    
+    # Chart JSON is highly repetitive and compresses around 10x
+    headers = {'Vary': 'Accept-Encoding'}
+    if request.accept_encodings['gzip'] > 0:
+        page = gzip_stream(page)
+        headers['Content-Encoding'] = 'gzip'
+    
+    return Response(stream_with_context(page), mimetype='text/html', headers=headers)
+
+def buffer_stream(fragments):
+    """Joins template fragments, sending them only at flush markers.
+
+    The markers sit just before each chart, so everything rendered so far
+    reaches the browser before the template blocks on that chart's future.
+    """
+    buffer = []
+    for fragment in fragments:
+        if fragment == FLUSH_MARKER:
+            if buffer:
+                yield ''.join(buffer)
+                buffer = []
+        else:
+            buffer.append(fragment)
+    yield ''.join(buffer)
+
+def gzip_stream(chunks):
+    """Gzips streamed text, flushing after each chunk so the browser can render it right away"""
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        yield compressor.compress(chunk.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
 
 def open_browser():
     webbrowser.open('http://127.0.0.1:5000/')